@@ -4,11 +4,75 @@ Backward-compatible wrapper for ck-help.
 
 Canonical implementation lives at:
   .opencode/skills/ck-help/scripts/ck-help.py
+
+Queries go to the canonical script's --daemon process when one is listening
+on $XDG_RUNTIME_DIR/ck-help-<hash>.sock (hash of the resolved skills
+directory); otherwise the script runs in-process and a
+daemon is started in the background for the next call. Set CK_HELP_DAEMON=0
+to always run in-process.
 """
 
-import runpy
+import hashlib
+import json
+import os
+import socket
+import subprocess
 import sys
+from importlib.machinery import SourceFileLoader
 from pathlib import Path
+from typing import Optional
+
+DAEMON_TIMEOUT = 5.0
+
+
+def daemon_socket_path(skills_dir: Path) -> Optional[Path]:
+    """Mirror of the canonical script's daemon socket location (checked by test_ck_help.py)."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir or not hasattr(socket, "AF_UNIX") or os.environ.get("CK_HELP_DAEMON") == "0":
+        return None
+    digest = hashlib.sha1(str(skills_dir).encode("utf-8")).hexdigest()[:12]
+    return Path(runtime_dir) / f"ck-help-{digest}.sock"
+
+
+def spawn_daemon(target: Path) -> None:
+    try:
+        subprocess.Popen(
+            [sys.executable, str(target), "--daemon"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def query_daemon(target: Path, args: list) -> Optional[dict]:
+    """Send ``args`` to the ck-help daemon; None means run in-process instead."""
+    # .opencode/skills/ck-help/scripts/ck-help.py -> .opencode/skills
+    skills_dir = target.parent.parent.parent
+    sock_path = daemon_socket_path(skills_dir)
+    if sock_path is None:
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(DAEMON_TIMEOUT)
+            sock.connect(str(sock_path))
+            sock.sendall((json.dumps({"argv": args, "skills_dir": str(skills_dir)}) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except (FileNotFoundError, ConnectionRefusedError):
+        spawn_daemon(target)
+        return None
+    except OSError:
+        return None
+
+    try:
+        response = json.loads(line)
+    except ValueError:
+        return None  # Daemon dropped the request (e.g. it is shutting down)
+    return response if isinstance(response, dict) else None
 
 
 def main() -> int:
@@ -18,14 +82,25 @@ def main() -> int:
         / "ck-help"
         / "scripts"
         / "ck-help.py"
-    )
+    ).resolve()
 
     if not target.exists():
         print(f"Error: canonical ck-help script not found: {target}", file=sys.stderr)
         return 1
 
-    # Preserve argv; run canonical script as __main__.
-    runpy.run_path(str(target), run_name="__main__")
+    # --batch and --daemon are process modes, not queries: always run them here.
+    response = None
+    if sys.argv[1:2] not in (["--batch"], ["--daemon"]):
+        response = query_daemon(target, sys.argv[1:])
+    if response is not None:
+        sys.stdout.write(response.get("stdout", ""))
+        return response.get("returncode", 0)
+
+    # Preserve argv; run canonical script as __main__. SourceFileLoader reuses
+    # (and refreshes) the __pycache__ bytecode, so repeat calls skip compile().
+    loader = SourceFileLoader("ck_help", str(target))
+    code = loader.get_code("ck_help")
+    exec(code, {"__name__": "__main__", "__file__": str(target), "__loader__": loader})
     return 0
 
 
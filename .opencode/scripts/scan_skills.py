@@ -3,15 +3,15 @@
 Scan .opencode/skills directory and extract skill metadata.
 """
 
+import hashlib
+import json
+import mmap
+import os
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
-try:
-    import yaml
-except ModuleNotFoundError:
-    raise SystemExit(
-        "PyYAML is required. Install with: python3 -m pip install -r .opencode/scripts/requirements.txt"
-    )
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 # Exact mappings for high-signal CK skills to avoid falling into "other".
 EXACT_CATEGORY_MAP = {
@@ -43,145 +43,494 @@ EXACT_CATEGORY_MAP = {
     "team": "dev-tools",
 }
 
-def extract_frontmatter(content: str) -> Dict:
-    """Extract YAML frontmatter from markdown content."""
-    match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+# Substring keyword -> category, checked in insertion order (first match wins).
+_KEYWORD_CATEGORY = {
+    # AI/ML
+    **dict.fromkeys(['ai-', 'gemini', 'multimodal', 'adk'], 'ai-ml'),
+    # Frontend
+    **dict.fromkeys(['frontend', 'ui', 'design', 'aesthetic', 'threejs'], 'frontend'),
+    # Backend
+    **dict.fromkeys(['backend', 'auth', 'payment'], 'backend'),
+    # Infrastructure
+    **dict.fromkeys(['devops', 'docker', 'cloudflare', 'gcloud'], 'infrastructure'),
+    # Database
+    **dict.fromkeys(['database', 'mongodb', 'postgresql', 'sql'], 'database'),
+    # Development Tools
+    **dict.fromkeys(['mcp', 'skill-creator', 'repomix', 'docs-seeker'], 'dev-tools'),
+    # Multimedia
+    **dict.fromkeys(['media', 'chrome-devtools', 'document-skills'], 'multimedia'),
+    # Frameworks
+    **dict.fromkeys(['web-frameworks', 'mobile', 'shopify'], 'frameworks'),
+    # Utilities
+    **dict.fromkeys(['debug', 'problem', 'code-review', 'planning', 'research', 'sequential'], 'utilities'),
+}
+
+# PyYAML is imported on first use so importing this module (e.g. for
+# categorize_skill) stays cheap and does not require it.
+_yaml = None
+_resolver = None
+
+def _get_yaml():
+    """Return the PyYAML module, importing it on first call."""
+    global _yaml
+    if _yaml is None:
+        try:
+            import yaml
+        except ModuleNotFoundError:
+            raise SystemExit(
+                "PyYAML is required. Install with: python3 -m pip install -r .opencode/scripts/requirements.txt"
+            )
+        _yaml = yaml
+    return _yaml
+
+def _get_resolver():
+    """Return a shared PyYAML implicit resolver for plain-scalar typing."""
+    global _resolver
+    if _resolver is None:
+        _resolver = _get_yaml().resolver.Resolver()
+    return _resolver
+
+_FM_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+# Per-file metadata cache, keyed by SKILL.md path and validated by mtime/size.
+_CACHE_PATH = Path('.opencode/skills/ck-help/scripts/.skills_cache.json')
+# Content-addressed cache (blake2b shortcode -> sha256 + metadata) that survives
+# fresh checkouts where every mtime changes. Bounded, oldest entries dropped.
+_HASH_CACHE_PATH = Path('.opencode/skills/ck-help/scripts/.skills_hash_cache.json')
+_HASH_CACHE_MAX_ENTRIES = 16 ** 4
+
+def _source_version() -> str:
+    """Hash of this script; any parser change invalidates the on-disk caches."""
+    try:
+        return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+    except OSError:
+        return ''
+
+_CACHE_VERSION = _source_version()
+
+def load_cache(cache_path: Path = _CACHE_PATH) -> Dict:
+    """Load the skill metadata cache, returning an empty cache on any error or version mismatch."""
+    try:
+        cache = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != _CACHE_VERSION:
+        return {}
+    entries = cache.get('entries')
+    return entries if isinstance(entries, dict) else {}
+
+def save_cache(cache: Dict, cache_path: Path = _CACHE_PATH, max_entries: Optional[int] = None) -> None:
+    """Write the skill metadata cache atomically, keeping the newest ``max_entries``."""
+    if max_entries is not None and len(cache) > max_entries:
+        cache = dict(list(cache.items())[-max_entries:])
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        tmp_path.write_text(json.dumps({'version': _CACHE_VERSION, 'entries': cache}), encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: could not write cache {cache_path}: {e}")
+
+_FM_KEY_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+# Values the line scanner cannot represent faithfully; these go through PyYAML.
+_YAML_INDICATORS = tuple('|>[]{},&*!%@`#?')
+_YAML_STR_TAG = 'tag:yaml.org,2002:str'
+
+def _parse_scalar(value: str):
+    """Return a flat scalar frontmatter value as str, or None if YAML is needed."""
+    if not value or value.startswith(_YAML_INDICATORS) or value == '-' or value.startswith('- '):
+        return None
+    if value[0] == '"':
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != '"' or '"' in inner or '\\' in inner:
+            return None
+        return inner
+    if value[0] == "'":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != "'" or "'" in inner.replace("''", ""):
+            return None
+        return inner.replace("''", "'")
+    if ': ' in value or ' #' in value or value.endswith(':'):
+        return None
+    # Plain scalars PyYAML would type (bools, numbers, dates, null).
+    if _get_resolver().resolve(_get_yaml().ScalarNode, value, (True, False)) != _YAML_STR_TAG:
+        return None
+    return value
+
+def _yaml_frontmatter(content: str) -> Dict:
+    """Parse frontmatter with PyYAML (fallback for non-flat frontmatter)."""
+    match = _FM_RE.match(content)
     if match:
         try:
-            return yaml.safe_load(match.group(1))
+            return _get_yaml().safe_load(match.group(1))
         except:
             return {}
     return {}
 
-def extract_first_paragraph(content: str) -> str:
-    """Extract first meaningful paragraph after frontmatter."""
-    # Remove frontmatter
-    content = re.sub(r'^---\s*\n.*?\n---\s*\n', '', content, flags=re.DOTALL)
+def extract_frontmatter(content: str) -> Dict:
+    """Extract YAML frontmatter from markdown content.
+
+    Flat ``key: value`` frontmatter is read with a line scanner; anything
+    else (block scalars, lists, mappings, continuation lines) uses PyYAML.
+    """
+    if not content.startswith('---\n'):
+        return _yaml_frontmatter(content)
+
+    result = {}
+    pos = 4
+    while True:
+        end = content.find('\n', pos)
+        if end == -1:
+            return _yaml_frontmatter(content)
+        line = content[pos:end]
+        pos = end + 1
+
+        if line.rstrip() == '---':
+            break
+        # Tabs, NEL, line separators and control characters: YAML rejects or
+        # treats them specially, so such blocks are left to safe_load.
+        if not line.isprintable():
+            return _yaml_frontmatter(content)
+        if not line.strip(' ') or line.startswith('#'):
+            continue
 
-    # Find first paragraph (after headings)
-    lines = content.split('\n')
+        key, sep, value = line.partition(':')
+        if not sep or not _FM_KEY_RE.match(key) or (value and value[0] != ' '):
+            return _yaml_frontmatter(content)
+        scalar = _parse_scalar(value.strip(' '))
+        if scalar is None:
+            return _yaml_frontmatter(content)
+        result[key] = scalar
+
+    return result if result else _yaml_frontmatter(content)
+
+def _find_first_paragraph_bounds(buf: bytes) -> Tuple[int, int, bool]:
+    """Return ``(start, end, complete)`` for the first paragraph in ASCII ``buf``.
+
+    Byte-level twin of the line loop in _first_paragraph: whitespace is what
+    ``str.strip`` removes for ASCII, and ``start == end`` means no paragraph.
+    """
+    n = len(buf)
+    start = 0
+    end = 0
+    count = 0
+    joined_len = 0
+    complete = False
+    i = 0
+    while i <= n:
+        j = i
+        while j < n and buf[j] != 10:
+            j += 1
+
+        ls = i
+        while ls < j and (buf[ls] == 32 or 9 <= buf[ls] <= 13 or 28 <= buf[ls] <= 31):
+            ls += 1
+        le = j
+        while le > ls and (buf[le - 1] == 32 or 9 <= buf[le - 1] <= 13 or 28 <= buf[le - 1] <= 31):
+            le -= 1
+
+        if ls == le or buf[ls] == 35:  # empty line or '#' heading
+            if count > 0:
+                complete = True
+                break
+        else:
+            if count == 0:
+                start = i
+                joined_len = le - ls
+            else:
+                joined_len += le - ls + 1
+            count += 1
+            end = j
+            if buf[le - 1] == 46 and joined_len > 50:  # ends with '.'
+                complete = True
+                break
+        i = j + 1
+    return start, end, complete or joined_len >= 200
+
+# Numba build of _find_first_paragraph_bounds, compiled on first use so that
+# importing this module never pays for Numba. False once it is known missing.
+_compiled_bounds = None
+
+def _get_compiled_bounds():
+    """Return the Numba-compiled paragraph scan, or None when Numba is not installed."""
+    global _compiled_bounds
+    if _compiled_bounds is None:
+        try:
+            from numba import njit
+        except ImportError:  # Optional: only speeds up extract_first_paragraph
+            _compiled_bounds = False
+        else:
+            _compiled_bounds = njit(cache=True)(_find_first_paragraph_bounds)
+    return _compiled_bounds or None
+
+def _first_paragraph(body: str) -> Tuple[str, bool]:
+    """Return the first paragraph of ``body`` and whether it ended inside ``body``.
+
+    The flag is False when the scan ran off the end of ``body`` before the
+    200-char result was settled, i.e. when more text could still change it.
+    """
+    # Compiled scan for ASCII documents (offsets equal str indices there)
+    compiled_bounds = _get_compiled_bounds()
+    if compiled_bounds is not None and body.isascii():
+        start, end, complete = compiled_bounds(body.encode('ascii'))
+        return ' '.join(line.strip() for line in body[start:end].split('\n'))[:200], complete
+
+    # Find first paragraph (after headings), one line at a time so the rest
+    # of the document is never split
     paragraph = []
+    joined_len = -1
+    complete = False
+    n = len(body)
+    i = 0
+
+    while i <= n:
+        j = body.find('\n', i)
+        if j == -1:
+            j = n
+        line = body[i:j].strip()
+        i = j + 1
 
-    for line in lines:
-        line = line.strip()
         # Skip headings and empty lines
         if line.startswith('#') or not line:
             if paragraph:  # If we've started collecting, stop
+                complete = True
                 break
             continue
 
         paragraph.append(line)
+        joined_len += len(line) + 1
 
         # Stop after first paragraph
-        if line.endswith('.') and len(' '.join(paragraph)) > 50:
+        if line.endswith('.') and joined_len > 50:
+            complete = True
             break
 
-    return ' '.join(paragraph)[:200]
-
-def scan_skills(base_path: Path) -> List[Dict]:
-    """Scan all skill files and extract metadata."""
-    skills = []
+    return ' '.join(paragraph)[:200], complete or joined_len >= 200
 
-    for skill_file in sorted(base_path.rglob('SKILL.md')):
-        # Get skill directory name
-        skill_dir = skill_file.parent
-        skill_name = skill_dir.name
-
-        # Skip template
-        if skill_name == 'template-skill':
-            continue
-
-        # Handle nested skills (like document-skills/*)
-        if skill_dir.parent.name != 'skills':
-            parent_name = skill_dir.parent.name
-            skill_name = f"{parent_name}/{skill_name}"
-
-        try:
-            content = skill_file.read_text()
-            frontmatter = extract_frontmatter(content)
-
-            description = frontmatter.get('description', '')
-            if not description:
-                description = extract_first_paragraph(content)
-
-            # Categorize based on content/name
-            category = categorize_skill(skill_name, description, content)
-
-            skill_entry = {
-                'name': skill_name,
-                'path': str(skill_file.relative_to(Path('.opencode/skills'))),
-                'description': description,
-                'category': category,
-                'has_scripts': (skill_dir / 'scripts').exists(),
-                'has_references': (skill_dir / 'references').exists()
-            }
-
-            # Include argument-hint if present in frontmatter
-            argument_hint = frontmatter.get('argument-hint', '')
-            if argument_hint:
-                skill_entry['argument_hint'] = str(argument_hint)
-
-            skills.append(skill_entry)
-        except Exception as e:
-            print(f"Error processing {skill_file}: {e}")
-
-    return skills
-
-def categorize_skill(name: str, description: str, content: str) -> str:
-    """Categorize skill based on name and content."""
-    lower_name = name.lower()
-    if lower_name in EXACT_CATEGORY_MAP:
-        return EXACT_CATEGORY_MAP[lower_name]
-
-    # AI/ML
-    if any(x in lower_name for x in ['ai-', 'gemini', 'multimodal', 'adk']):
-        return 'ai-ml'
-
-    # Frontend
-    if any(x in lower_name for x in ['frontend', 'ui', 'design', 'aesthetic', 'threejs']):
-        return 'frontend'
-
-    # Backend
-    if any(x in lower_name for x in ['backend', 'auth', 'payment']):
-        return 'backend'
-
-    # Infrastructure
-    if any(x in lower_name for x in ['devops', 'docker', 'cloudflare', 'gcloud']):
-        return 'infrastructure'
-
-    # Database
-    if any(x in lower_name for x in ['database', 'mongodb', 'postgresql', 'sql']):
-        return 'database'
-
-    # Development Tools
-    if any(x in lower_name for x in ['mcp', 'skill-creator', 'repomix', 'docs-seeker']):
-        return 'dev-tools'
-
-    # Multimedia
-    if any(x in lower_name for x in ['media', 'chrome-devtools', 'document-skills']):
-        return 'multimedia'
-
-    # Frameworks
-    if any(x in lower_name for x in ['web-frameworks', 'mobile', 'shopify']):
-        return 'frameworks'
-
-    # Utilities
-    if any(x in lower_name for x in ['debug', 'problem', 'code-review', 'planning', 'research', 'sequential']):
-        return 'utilities'
+def extract_first_paragraph(content: str) -> str:
+    """Extract first meaningful paragraph after frontmatter."""
+    # Remove frontmatter
+    return _first_paragraph(_FM_RE.sub('', content, count=1))[0]
+
+def _build_meta(frontmatter: Dict, description) -> Dict:
+    meta = {'description': description}
+
+    # Include argument-hint if present in frontmatter
+    argument_hint = frontmatter.get('argument-hint', '')
+    if argument_hint:
+        meta['argument_hint'] = str(argument_hint)
+
+    return meta
+
+def _is_valid_meta(meta) -> bool:
+    """Whether a cached metadata record has the shape _build_meta produces."""
+    return isinstance(meta, dict) and 'description' in meta
+
+def _parse_skill_meta(content: str) -> Dict:
+    """Extract the cacheable metadata (description, argument hint) from SKILL.md content."""
+    frontmatter = extract_frontmatter(content)
+
+    description = frontmatter.get('description', '')
+    if not description:
+        description = extract_first_paragraph(content)
+
+    return _build_meta(frontmatter, description)
+
+# Bytes of body decoded for the first-paragraph fallback before reading it all.
+_PARAGRAPH_WINDOW = 4096
+
+def _decode(data: bytes) -> str:
+    """Decode like ``Path.read_text`` with universal newlines, as UTF-8."""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+def _window_paragraph(mm: mmap.mmap, body_start: int) -> Optional[str]:
+    """First paragraph from a bounded window of the body, or None if undecided."""
+    window_end = body_start + _PARAGRAPH_WINDOW
+    if window_end >= len(mm):
+        chunk = mm[body_start:]
+        return None if b'\r' in chunk else _first_paragraph(chunk.decode('utf-8'))[0]
+
+    # Cut at the last newline so no line (or UTF-8 sequence) is split.
+    chunk = mm[body_start:window_end]
+    cut = chunk.rfind(b'\n')
+    if cut == -1 or b'\r' in chunk:
+        return None
+    text, complete = _first_paragraph(chunk[:cut].decode('utf-8'))
+    return text if complete else None
+
+def _read_skill_meta(mm: mmap.mmap) -> Dict:
+    """Parse metadata from a mapped SKILL.md, decoding as little of it as possible.
+
+    Only the frontmatter block is decoded when it carries a description, then
+    a window of the body; the whole file is decoded as a last resort.
+    """
+    fm_end = mm.find(b'\n---\n', 4) if mm[:4] == b'---\n' else -1
+    if fm_end != -1:
+        head_bytes = mm[:fm_end + 5]
+        if b'\r' not in head_bytes:
+            head = head_bytes.decode('utf-8')
+            match = _FM_RE.match(head)
+            # Same block the full-content regex would pick: no earlier closer, and
+            # no leading whitespace the opener's \s* could swallow to reach a later one.
+            if match and match.end() == len(head) and not head[4:5].isspace():
+                frontmatter = extract_frontmatter(head)
+                if isinstance(frontmatter, dict):
+                    description = frontmatter.get('description', '')
+                    if not description:
+                        description = _window_paragraph(mm, len(head_bytes))
+                    if description is not None:
+                        return _build_meta(frontmatter, description)
+
+    return _parse_skill_meta(_decode(mm[:]))
+
+def _load_skill_meta(mm: mmap.mmap, hash_cache: Optional[Dict]) -> Dict:
+    """Parse metadata, reusing a content-hash cache hit when available."""
+    if hash_cache is None:
+        return _read_skill_meta(mm)
+
+    # Keyed by the cache version too, so entries from another parser never match.
+    shortcode = hashlib.blake2b(mm, digest_size=8, key=_CACHE_VERSION.encode('ascii')).hexdigest()
+    digest = hashlib.sha256(mm).hexdigest()
+
+    hashed = hash_cache.pop(shortcode, None)
+    if isinstance(hashed, dict) and hashed.get('sha256') == digest and _is_valid_meta(hashed.get('meta')):
+        meta = hashed['meta']
+    else:
+        meta = _read_skill_meta(mm)
+    # Re-insert so the most recently used entries survive the size cap.
+    hash_cache[shortcode] = {'sha256': digest, 'meta': meta}
+    return meta
+
+def _scan_skill_file(
+    skill_file: Path,
+    subdirs: FrozenSet[str],
+    base_prefix: str,
+    previous: Dict,
+    cache: Optional[Dict],
+    hash_cache: Optional[Dict],
+) -> Optional[Dict]:
+    """Build the metadata entry for one SKILL.md, or None if it is skipped.
+
+    ``subdirs`` holds the skill directory's subdirectory names from the walk;
+    ``base_prefix`` is the scan root as a string ending in ``os.sep``.
+    """
+    # Get skill directory name
+    skill_dir = skill_file.parent
+    skill_name = skill_dir.name
+
+    # Skip template
+    if skill_name == 'template-skill':
+        return None
+
+    # Handle nested skills (like document-skills/*)
+    if skill_dir.parent.name != 'skills':
+        parent_name = skill_dir.parent.name
+        skill_name = f"{parent_name}/{skill_name}"
+
+    # Categorize based on name alone (kept out of the cache so mapping changes apply).
+    # Skill names are lowercase kebab-case, so lowering is normally a no-op.
+    lower_name = skill_name if skill_name.islower() else skill_name.lower()
+    category = categorize_skill(skill_name, lower_name)
+
+    try:
+        st = skill_file.stat()
+        path_str = os.fspath(skill_file)
+        cache_key = path_str
+        cached = previous.get(cache_key)
+
+        if (
+            isinstance(cached, dict)
+            and cached.get('mtime_ns') == st.st_mtime_ns
+            and cached.get('size') == st.st_size
+            and _is_valid_meta(cached.get('meta'))
+        ):
+            meta = cached['meta']
+        elif st.st_size == 0:
+            meta = _parse_skill_meta('')  # mmap cannot map empty files
+        else:
+            with skill_file.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                meta = _load_skill_meta(mm, hash_cache)
+
+        if cache is not None:
+            cache[cache_key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'meta': meta}
+
+        skill_entry = {
+            'name': skill_name,
+            'path': path_str[len(base_prefix):],
+            'description': meta['description'],
+            'category': category,
+            'has_scripts': 'scripts' in subdirs,
+            'has_references': 'references' in subdirs
+        }
+        if meta.get('argument_hint'):
+            skill_entry['argument_hint'] = meta['argument_hint']
+
+        return skill_entry
+    except Exception as e:
+        print(f"Error processing {skill_file}: {e}")
+        return None
+
+_SKIP_DIRS = {'.git', '__pycache__'}
+
+def _iter_skill_files(base_path: Path):
+    """Yield ``(SKILL.md path, subdirectory names)`` pairs from one pruned os.walk."""
+    for dirpath, dirnames, filenames in os.walk(base_path):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        if 'SKILL.md' in filenames:
+            yield Path(dirpath) / 'SKILL.md', frozenset(dirnames)
+
+def scan_skills(
+    base_path: Path, cache: Optional[Dict] = None, hash_cache: Optional[Dict] = None
+) -> List[Dict]:
+    """Scan all skill files and extract metadata.
+
+    Files are processed on a thread pool (the work is mostly file I/O);
+    results keep the sorted path order. When ``cache`` is given, unchanged
+    SKILL.md files are served from it and the dict is rewritten in place to
+    hold only the entries seen during this scan. Files that miss it are
+    looked up by content hash in ``hash_cache``, which is updated in place.
+    """
+    previous = dict(cache) if cache is not None else {}
+    if cache is not None:
+        cache.clear()
+
+    skill_files = sorted(_iter_skill_files(base_path), key=lambda item: item[0])
+    # Walked paths are built from os.walk(base_path), so they share this prefix
+    # (Path drops a bare '.' root, so there is no prefix to strip then).
+    base_str = os.fspath(Path(base_path))
+    base_prefix = '' if base_str == '.' else os.path.join(base_str, '')
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        entries = executor.map(
+            lambda item: _scan_skill_file(item[0], item[1], base_prefix, previous, cache, hash_cache),
+            skill_files,
+        )
+        return [entry for entry in entries if entry]
+
+def categorize_skill(name: str, lower_name: Optional[str] = None) -> str:
+    """Categorize skill based on its name.
+
+    ``lower_name`` may carry ``name.lower()`` when the caller already has it.
+    """
+    if lower_name is None:
+        lower_name = name.lower()
+    category = EXACT_CATEGORY_MAP.get(lower_name)
+    if category:
+        return category
+
+    for keyword, category in _KEYWORD_CATEGORY.items():
+        if keyword in lower_name:
+            return category
 
     return 'other'
 
 def group_by_category(skills: List[Dict]) -> Dict[str, List[Dict]]:
     """Group skills by category."""
-    categories = {}
+    categories = defaultdict(list)
 
     for skill in skills:
-        category = skill['category']
-        if category not in categories:
-            categories[category] = []
-        categories[category].append(skill)
+        categories[skill['category']].append(skill)
 
-    return categories
+    return dict(categories)
 
 def main():
     """Main execution."""
@@ -192,7 +541,9 @@ def main():
         return
 
     print("Scanning skills...")
-    skills = scan_skills(base_path)
+    cache = load_cache()
+    hash_cache = load_cache(_HASH_CACHE_PATH)
+    skills = scan_skills(base_path, cache, hash_cache)
 
     print(f"\nFound {len(skills)} skills\n")
 
@@ -222,16 +573,22 @@ def main():
     # Output YAML to ck-help scripts directory
     output_path = Path('.opencode/skills/ck-help/scripts/skills_data.yaml')
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(yaml.dump(skills, allow_unicode=True, default_flow_style=False))
+    yaml = _get_yaml()
+    # libyaml's CSafeDumper when PyYAML was built with it
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    with output_path.open('wb') as f:
+        yaml.dump(skills, f, Dumper=dumper, allow_unicode=True, default_flow_style=False, encoding='utf-8')
     print(f"\n✓ Saved metadata to {output_path}")
 
     # Legacy location now points to canonical source to avoid data drift.
     legacy_path = Path('.opencode/scripts/skills_data.yaml')
-    legacy_path.write_text(
-        "# Skills catalog moved to .opencode/skills/ck-help/scripts/skills_data.yaml\n"
-        "# Regenerate via: python3 .opencode/scripts/scan_skills.py\n",
-        encoding='utf-8',
+    legacy_path.write_bytes(
+        b"# Skills catalog moved to .opencode/skills/ck-help/scripts/skills_data.yaml\n"
+        b"# Regenerate via: python3 .opencode/scripts/scan_skills.py\n"
     )
 
+    save_cache(cache)
+    save_cache(hash_cache, _HASH_CACHE_PATH, max_entries=_HASH_CACHE_MAX_ENTRIES)
+
 if __name__ == '__main__':
     main()
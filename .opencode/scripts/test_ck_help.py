@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 """
 Smoke/integration tests for canonical ck-help script.
-Run: python3 .opencode/scripts/test_ck_help.py
+Run: python3 .opencode/scripts/test_ck_help.py [--isolate]
+
+Cases run in-process by default; --isolate runs ck-help in a subprocess.
 """
 
+import importlib.util
+import io
+import json
+import os
 import subprocess
 import sys
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 SCRIPT_PATH = (
     Path(__file__).resolve().parent.parent
@@ -17,17 +24,73 @@ SCRIPT_PATH = (
     / "ck-help.py"
 )
 
+WRAPPER_PATH = Path(__file__).resolve().with_name("ck-help.py")
+
 passed = 0
 failed = 0
 failures = []
+batch_results: Dict[str, Tuple[str, int]] = {}
+ck_help = None
+
+
+def load_module(name: str, path: Path):
+    """Import a script as a module (ck-help file names are not importable)."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_ck_help():
+    return load_module("ck_help", SCRIPT_PATH)
+
+
+def run_in_process(args: str) -> Tuple[str, int]:
+    buf = io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = [str(SCRIPT_PATH)] + (args.split() if args else [])
+    code = 0
+    try:
+        with redirect_stdout(buf), redirect_stderr(buf):
+            ck_help.main()
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    finally:
+        sys.argv = saved_argv
+    return buf.getvalue(), code
 
 
 def run_ck_help(args: str) -> Tuple[str, int]:
+    if args in batch_results:
+        return batch_results[args]
+    if ck_help is not None:
+        return run_in_process(args)
     cmd = [sys.executable, str(SCRIPT_PATH)] + (args.split() if args else [])
     result = subprocess.run(cmd, capture_output=True, text=True)
     return result.stdout + result.stderr, result.returncode
 
 
+def run_batch(queries: List[str]) -> Dict[str, Tuple[str, int]]:
+    """Run all queries in one ck-help process; empty dict if --batch is unavailable."""
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), "--batch", "-"],
+        input="\n".join(queries),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return {}
+
+    results = {}
+    try:
+        for line in result.stdout.splitlines():
+            record = json.loads(line)
+            results[record["query"]] = (record["stdout"], record["returncode"])
+    except (ValueError, KeyError, TypeError):
+        return {}
+    return results
+
+
 def count_output_markers(output: str) -> int:
     return len([line for line in output.splitlines() if line.startswith("@CK_OUTPUT_TYPE:")])
 
@@ -73,52 +136,97 @@ def test(
         print(f"✅ {name}")
 
 
-def main():
-    print("=" * 60)
-    print("ck-help canonical test suite")
-    print("=" * 60)
+def test_daemon_socket_path():
+    """The wrapper must compute the same daemon socket as the canonical script."""
+    global passed, failed, failures
+    name = "wrapper and canonical daemon socket paths match"
+    canonical = load_module("ck_help_socket", SCRIPT_PATH)
+    wrapper = load_module("ck_help_wrapper", WRAPPER_PATH)
+    skills_dirs = [SCRIPT_PATH.parent.parent.parent, Path("/elsewhere/.opencode/skills")]
+    errors = []
+
+    saved_env = {key: os.environ.get(key) for key in ("XDG_RUNTIME_DIR", "CK_HELP_DAEMON")}
+    os.environ["XDG_RUNTIME_DIR"] = "/run/user/ck-help-test"
+    os.environ.pop("CK_HELP_DAEMON", None)
+    try:
+        paths = [canonical.daemon_socket_path(d) for d in skills_dirs]
+        for skills_dir, path in zip(skills_dirs, paths):
+            if wrapper.daemon_socket_path(skills_dir) != path:
+                errors.append(f"Socket paths differ for {skills_dir}")
+        if len(set(paths)) != len(paths):
+            errors.append("Different skills dirs share a socket")
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
 
-    test(
-        "overview renders",
-        "",
+    if errors:
+        failed += 1
+        failures.append((name, "", errors, ""))
+        print(f"❌ {name}")
+        for err in errors:
+            print(f"   - {err}")
+    else:
+        passed += 1
+        print(f"✅ {name}")
+
+
+TESTS = [
+    dict(
+        name="overview renders",
+        args="",
         expect_type="category-guide",
         expect_contains=["claudekit skills", "quick start", "/code-review"],
-    )
-
-    test(
-        "category query routes correctly",
-        "fix",
+    ),
+    dict(
+        name="category query routes correctly",
+        args="fix",
         expect_type="category-guide",
         expect_contains=["fixing issues", "/fix --parallel"],
-    )
-
-    test(
-        "multi-word task routes to recommendation",
-        "test my login",
+    ),
+    dict(
+        name="multi-word task routes to recommendation",
+        args="test my login",
         expect_type="task-recommendations",
         expect_contains=["recommended for", "/test"],
-    )
-
-    test(
-        "subcommand space syntax resolves to command details",
-        "plan archive",
+    ),
+    dict(
+        name="subcommand space syntax resolves to command details",
+        args="plan archive",
         expect_type="command-details",
         expect_contains=["/plan archive", "usage"],
-    )
-
-    test(
-        "legacy colon syntax alias resolves to command details",
-        "plan:validate",
+    ),
+    dict(
+        name="legacy colon syntax alias resolves to command details",
+        args="plan:validate",
         expect_type="command-details",
         expect_contains=["/plan validate", "usage"],
-    )
-
-    test(
-        "unknown skill query falls back to search",
-        "unknown:thing",
+    ),
+    dict(
+        name="unknown skill query falls back to search",
+        args="unknown:thing",
         expect_type="search-results",
         expect_contains=["no skills found"],
-    )
+    ),
+]
+
+
+def main():
+    global ck_help
+    print("=" * 60)
+    print("ck-help canonical test suite")
+    print("=" * 60)
+
+    if "--isolate" in sys.argv[1:]:
+        batch_results.update(run_batch([case["args"] for case in TESTS]))
+    else:
+        ck_help = load_ck_help()
+
+    for case in TESTS:
+        test(**case)
+    test_daemon_socket_path()
 
     print("=" * 60)
     print(f"RESULT: {passed} passed, {failed} failed")
@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
-"""Integration tests for canonical ck-help query routing."""
+"""Integration tests for canonical ck-help query routing.
 
+Queries run in-process by default; pass --isolate to use a subprocess.
+"""
+
+import importlib.util
+import io
+import json
 import subprocess
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
 SCRIPT = (
@@ -14,7 +21,37 @@ SCRIPT = (
 )
 
 
+BATCH_RESULTS: dict[str, str] = {}
+CK_HELP = None
+
+
+def load_ck_help():
+    """Import the canonical script as a module (its file name is not importable)."""
+    spec = importlib.util.spec_from_file_location("ck_help", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_in_process(query: str) -> str:
+    buf = io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = [str(SCRIPT)] + query.split()
+    try:
+        with redirect_stdout(buf):
+            CK_HELP.main()
+    except SystemExit:
+        pass
+    finally:
+        sys.argv = saved_argv
+    return buf.getvalue()
+
+
 def run_ck_help(query: str) -> str:
+    if query in BATCH_RESULTS:
+        return BATCH_RESULTS[query]
+    if CK_HELP is not None:
+        return run_in_process(query)
     result = subprocess.run(
         [sys.executable, str(SCRIPT)] + query.split(),
         capture_output=True,
@@ -23,6 +60,25 @@ def run_ck_help(query: str) -> str:
     return result.stdout
 
 
+def run_batch(queries: list[str]) -> dict[str, str]:
+    """Route all queries in one ck-help process; empty dict if --batch is unavailable."""
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT), "--batch", "-"],
+        input="\n".join(queries),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return {}
+    try:
+        return {
+            record["query"]: record["stdout"]
+            for record in map(json.loads, result.stdout.splitlines())
+        }
+    except (ValueError, KeyError, TypeError):
+        return {}
+
+
 def marker(output: str) -> str:
     for line in output.splitlines():
         if line.startswith("@CK_OUTPUT_TYPE:"):
@@ -47,6 +103,7 @@ TESTS = [
 
 
 def main() -> int:
+    global CK_HELP
     passed = 0
     failed = 0
 
@@ -54,6 +111,11 @@ def main() -> int:
     print("ck-help integration tests")
     print("=" * 60)
 
+    if "--isolate" in sys.argv[1:]:
+        BATCH_RESULTS.update(run_batch([query for query, _, _ in TESTS]))
+    else:
+        CK_HELP = load_ck_help()
+
     for query, expected_type, snippets in TESTS:
         ok = assert_route(query, expected_type, snippets)
         print(f"{'✅' if ok else '❌'} {query!r} -> {expected_type}")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Equivalence tests for scan_skills fast paths.
+
+The line-scanning frontmatter parser must agree with the yaml.safe_load path,
+the partial mmap read must agree with decoding the whole file (with LF, CRLF
+and CR line endings), and the byte-level paragraph scan Numba compiles must
+agree with the pure-Python one, on every document.
+
+Run: python3 .opencode/scripts/test_scan_skills.py
+"""
+
+import importlib.util
+import mmap
+import tempfile
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent / "scan_skills.py"
+
+SCAN_SKILLS = None
+
+
+def load_scan_skills():
+    spec = importlib.util.spec_from_file_location("scan_skills", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+LONG_TEXT = "Long lines keep going without a full stop " * 4
+BIG_BODY = "# Heading\n\n" + "\n".join(["#"] * 2100) + "\n\nFinally the paragraph. " + LONG_TEXT + "\n"
+
+DOCUMENTS = [
+    ("flat", "---\nname: alpha\ndescription: Does alpha things\n---\n\n# Alpha\n"),
+    ("quoted", "---\nname: 'it''s'\ndescription: \"Quoted: yes\"\n---\nbody\n"),
+    ("comments and blanks", "---\n# note\nname: beta\n\ndescription: Beta   \n---\n"),
+    ("typed hint", "---\nname: gamma\ndescription: Gamma\nargument-hint: 3\n---\n"),
+    ("bool and null", "---\nname: yes\ndescription: null\n---\nFallback paragraph here.\n"),
+    ("block scalar", "---\nname: delta\ndescription: |\n  Multi\n  line\n---\n"),
+    ("list value", "---\nname: eps\ndescription: [a, b]\n---\n"),
+    ("leading comma", "---\nname: zeta\ndescription: ,starts with comma\n---\n"),
+    ("leading bracket", "---\nname: eta\ndescription: ]starts with bracket\n---\n"),
+    ("leading brace", "---\nname: theta\ndescription: }starts with brace\n---\n"),
+    ("inner comma", "---\nname: iota\ndescription: a, b, and c\n---\n"),
+    ("colon in value", "---\nname: kappa\ndescription: key: value\n---\n"),
+    ("tab in value", "---\nname: lambda\ndescription: tab\there\n---\n"),
+    ("trailing nbsp", "---\nname: upsilon\ndescription: Trailing nbsp\xa0\n---\n"),
+    ("tab-only line", "---\nname: phi\n\t\ndescription: Tab line\n---\nBody paragraph wins here.\n"),
+    ("next line char", "---\nname: chi\ndescription: a\x85b\n---\nBody.\n"),
+    ("line separator", "---\nname: psi\ndescription: a\u2028b\n---\nBody.\n"),
+    ("control char", "---\nname: omega\ndescription: bell\x07here\n---\nBody.\n"),
+    ("bare dash", "---\nname: dash\ndescription: -\n---\nBody.\n"),
+    ("second closer", "---\nname: mu\n--- \ndescription: after closer\n---\nBody text.\n"),
+    ("no frontmatter", "# Title\n\nJust a paragraph of text.\n"),
+    ("mixed endings", "---\nname: tau\ndescription: one\rtwo\r\n---\nBody.\n"),
+    ("blank first block", "---\n\n---\ndescription: Real description\n---\n\nBody text.\n"),
+    ("whitespace first block", "---\n  \n---\nname: x\ndescription: Hi\n---\n"),
+    ("scalar frontmatter", "---\njust text\n---\nBody text.\n"),
+    ("unclosed", "---\nname: nu\ndescription: never closed\n"),
+    ("non-ascii", "---\nname: xi\ndescription: Café ünïcode ✓\n---\n"),
+    ("non-ascii body", "---\nname: omicron\n---\n\n# Título\n\nPárrafo con acentos. " + LONG_TEXT + "\n"),
+    ("big body", "---\nname: pi\n---\n" + BIG_BODY),
+    ("paragraph across window", "---\nname: rho\n---\n" + "#\n" * 2030 + "\n" + LONG_TEXT * 3 + "\n"),
+    ("fifty-char sentence", "---\nname: fifty\n---\n" + "f" * 49 + ".\nstill the same paragraph\n"),
+    ("odd whitespace body", "---\nname: ws\n---\n\x0b\n\x1c# h\n \x0cPara line one\x1f\nline two.\n"),
+    ("multibyte at window edge", "---\nname: sigma\n---\n" + "#\n" * 2045 + "\nééééé " + LONG_TEXT + "\n"),
+]
+
+NEWLINES = [("lf", "\n"), ("crlf", "\r\n"), ("cr", "\r")]
+
+
+def check_frontmatter(content: str) -> bool:
+    # scan_skills only parses decoded text, where line endings are already "\n"
+    text = SCAN_SKILLS._decode(content.encode("utf-8"))
+    return SCAN_SKILLS.extract_frontmatter(text) == SCAN_SKILLS._yaml_frontmatter(text)
+
+
+def check_paragraph_bounds(content: str) -> bool:
+    """Uncompiled _find_first_paragraph_bounds must reproduce _first_paragraph."""
+    body = SCAN_SKILLS._FM_RE.sub("", SCAN_SKILLS._decode(content.encode("utf-8")), count=1)
+    start, end, complete = SCAN_SKILLS._find_first_paragraph_bounds(body.encode("ascii"))
+    joined = " ".join(line.strip() for line in body[start:end].split("\n"))[:200]
+
+    saved = SCAN_SKILLS._compiled_bounds
+    SCAN_SKILLS._compiled_bounds = False  # force the str.find loop
+    try:
+        expected = SCAN_SKILLS._first_paragraph(body)
+    finally:
+        SCAN_SKILLS._compiled_bounds = saved
+    return (joined, complete) == expected
+
+
+def outcome(func, *args):
+    """Result of ``func(*args)``, or the exception type, so failures compare too."""
+    try:
+        return func(*args)
+    except Exception as e:
+        return type(e)
+
+
+def check_read_meta(raw: bytes) -> bool:
+    """_read_skill_meta on a mapped file must match parsing the fully decoded file."""
+    expected = outcome(SCAN_SKILLS._parse_skill_meta, SCAN_SKILLS._decode(raw))
+    with tempfile.TemporaryFile() as f:
+        f.write(raw)
+        f.flush()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return outcome(SCAN_SKILLS._read_skill_meta, mm) == expected
+
+
+def main() -> int:
+    global SCAN_SKILLS
+    passed = 0
+    failed = 0
+
+    print("=" * 60)
+    print("scan_skills equivalence tests")
+    print("=" * 60)
+
+    SCAN_SKILLS = load_scan_skills()
+
+    for label, content in DOCUMENTS:
+        ok = check_frontmatter(content)
+        print(f"{'✅' if ok else '❌'} frontmatter: {label}")
+        if ok:
+            passed += 1
+        else:
+            failed += 1
+
+    for label, content in DOCUMENTS:
+        for newline_name, newline in NEWLINES:
+            ok = check_read_meta(content.replace("\n", newline).encode("utf-8"))
+            print(f"{'✅' if ok else '❌'} read meta ({newline_name}): {label}")
+            if ok:
+                passed += 1
+            else:
+                failed += 1
+
+    for label, content in DOCUMENTS:
+        if not content.isascii():
+            continue
+        ok = check_paragraph_bounds(content)
+        print(f"{'✅' if ok else '❌'} paragraph bounds: {label}")
+        if ok:
+            passed += 1
+        else:
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULT: {passed} passed, {failed} failed")
+    print("=" * 60)
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
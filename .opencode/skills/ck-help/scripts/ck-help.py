@@ -9,12 +9,21 @@ Usage:
     python ck-help.py plan validate      # Subcommand details
     python ck-help.py debug login error  # Task recommendations
     python ck-help.py auth               # Search (unknown word)
+    python ck-help.py --batch -          # One query per stdin line, JSON out
+    python ck-help.py --daemon           # Serve queries over a Unix socket
 """
 
 import sys
+import os
 import re
 import io
+import json
+import hashlib
+import socket
+import socketserver
+from contextlib import redirect_stdout
 from pathlib import Path
+from typing import Optional, Tuple
 
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
@@ -523,7 +532,7 @@ def discover_skills(skills_dir: Path) -> dict:
     categories = {}
 
     if not skills_dir.exists():
-        return {"commands": skills, "categories": categories}
+        return {"commands": skills, "categories": categories, "routes": build_routes(skills, categories)}
 
     # Scan all SKILL.md files (one per skill directory)
     for skill_md in sorted(skills_dir.rglob("SKILL.md")):
@@ -582,7 +591,39 @@ def discover_skills(skills_dir: Path) -> dict:
     for cat in skills:
         skills[cat].sort(key=lambda x: x["name"])
 
-    return {"commands": skills, "categories": categories}
+    return {"commands": skills, "categories": categories, "routes": build_routes(skills, categories)}
+
+
+def command_key(name: str) -> str:
+    """Comparable form of a skill name for exact command lookup."""
+    return normalize_command_query(name).replace("-", "").replace(" ", "")
+
+
+def build_routes(commands: dict, categories: dict) -> dict:
+    """Precompute exact-match lookup tables used by query routing.
+
+    ``commands`` maps command_key() to the first skill entry with that key and
+    ``categories`` maps lowercase names to category keys, discovered first and
+    then CATEGORY_GUIDES, matching the order of the old linear scans.
+    """
+    command_routes = {}
+    for cmds in commands.values():
+        for cmd in cmds:
+            command_routes.setdefault(command_key(cmd["name"]), cmd)
+
+    category_routes = {}
+    for key in list(categories) + list(CATEGORY_GUIDES):
+        category_routes.setdefault(key.lower(), key)
+
+    return {"commands": command_routes, "categories": category_routes}
+
+
+def get_routes(data: dict) -> dict:
+    """Routing tables for ``data``, building them if the catalog lacks them."""
+    routes = data.get("routes")
+    if routes is None:
+        routes = data["routes"] = build_routes(data["commands"], data["categories"])
+    return routes
 
 
 def detect_intent(input_str: str, categories: list) -> str:
@@ -685,21 +726,10 @@ def show_category_guide(data: dict, category: str, prefix: str) -> None:
     categories = data["categories"]
     commands = data["commands"]
 
-    # Find matching category (case-insensitive) - check both discovered and CATEGORY_GUIDES
-    cat_key = None
+    # Find matching category (case-insensitive) - discovered categories first, then
+    # CATEGORY_GUIDES for categories without discovered commands (worktree, kanban, etc.)
     category_lower = category.lower()
-
-    for key in categories:
-        if key.lower() == category_lower:
-            cat_key = key
-            break
-
-    # Also check CATEGORY_GUIDES for categories without discovered commands (worktree, kanban, etc.)
-    if not cat_key:
-        for key in CATEGORY_GUIDES.keys():
-            if key.lower() == category_lower:
-                cat_key = key
-                break
+    cat_key = get_routes(data)["categories"].get(category_lower)
 
     # Fuzzy match for typos (e.g., "notifcations" → "notifications")
     if not cat_key:
@@ -759,19 +789,9 @@ def show_command(data: dict, command: str, prefix: str) -> None:
         print(f"**Usage:** `{subcommand['usage']}`")
         return
 
-    # Normalize search term
-    search = normalize_command_query(command).replace(":", "").replace("-", "").replace(" ", "")
-
-    found = None
-    for cmds in commands.values():
-        for cmd in cmds:
-            # Normalize skill name for comparison
-            name = normalize_command_query(cmd["name"]).replace("-", "").replace(" ", "")
-            if name == search:
-                found = cmd
-                break
-        if found:
-            break
+    # Normalize search term and look it up among normalized skill names
+    search = command_key(command.replace(":", ""))
+    found = get_routes(data)["commands"].get(search)
 
     if not found:
         if ":" in command:
@@ -1271,27 +1291,8 @@ def show_coding_level_guide() -> None:
     print("*Tip: Use `-1` (disabled) unless you're teaching or want guided explanations.*")
 
 
-def main():
-    # Find .opencode/skills directory
-    script_path = Path(__file__).resolve()
-    # .opencode/skills/ck-help/scripts/ck-help.py -> .opencode/skills
-    skills_dir = script_path.parent.parent.parent
-
-    if not skills_dir.exists():
-        print("Error: .opencode/skills/ directory not found.")
-        sys.exit(1)
-
-    # Discover skills from SKILL.md files
-    data = discover_skills(skills_dir)
-
-    if not data["commands"]:
-        print("No skills found in .opencode/skills/")
-        sys.exit(1)
-
-    # Parse input
-    args = sys.argv[1:]
-    input_str = " ".join(args).strip()
-
+def route_query(data: dict, input_str: str) -> None:
+    """Print the help output for a single query."""
     # Special case: config documentation (not a command category)
     if input_str.lower() in ["config", "configuration", ".ck.json", "ck.json"]:
         show_config_guide()
@@ -1317,5 +1318,154 @@ def main():
         do_search(data, input_str, "")
 
 
+def capture_query(data: dict, input_str: str) -> Tuple[str, int]:
+    """Route a query and return its printed output and exit code."""
+    buf = io.StringIO()
+    returncode = 0
+    with redirect_stdout(buf):
+        try:
+            route_query(data, input_str)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+    return buf.getvalue(), returncode
+
+
+def run_batch(data: dict, source: str) -> None:
+    """Route one query per line and emit a JSON record per query.
+
+    Each record is ``{query, stdout, returncode, marker}``; ``source`` is a
+    file path or ``-`` for stdin. The catalog is discovered once for all queries.
+    """
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(source).read_text(encoding="utf-8").splitlines()
+
+    for query in lines:
+        output, returncode = capture_query(data, " ".join(query.split()))
+        marker = next(
+            (line[len("@CK_OUTPUT_TYPE:"):].strip() for line in output.splitlines() if line.startswith("@CK_OUTPUT_TYPE:")),
+            "",
+        )
+        print(json.dumps({"query": query, "stdout": output, "returncode": returncode, "marker": marker}))
+
+
+# Daemon mode: a long-lived process keeps the catalog in memory and answers
+# newline-delimited JSON requests ({"argv": [...]} -> {"stdout", "returncode"}).
+# It exits after DAEMON_IDLE_TIMEOUT seconds without requests, or when this
+# script changes on disk.
+DAEMON_IDLE_TIMEOUT = 600
+
+
+def daemon_socket_path(skills_dir: Path) -> Optional[Path]:
+    """Socket path for daemon mode, or None where it is unsupported.
+
+    The name is derived from the resolved skills directory so checkouts
+    never share a daemon.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir or not hasattr(socket, "AF_UNIX"):
+        return None
+    digest = hashlib.sha1(str(skills_dir).encode("utf-8")).hexdigest()[:12]
+    return Path(runtime_dir) / f"ck-help-{digest}.sock"
+
+
+def catalog_signature(skills_dir: Path) -> tuple:
+    """Cheap change detector for the skill catalog (the SKILL.md files discover_skills reads)."""
+    files = sorted(skills_dir.rglob("SKILL.md"))
+    return (skills_dir.stat().st_mtime_ns,) + tuple((str(f), f.stat().st_mtime_ns) for f in files)
+
+
+def run_daemon(skills_dir: Path) -> None:
+    """Serve queries over a Unix socket until idle or this script is modified."""
+    sock_path = daemon_socket_path(skills_dir)
+    if sock_path is None:
+        print("Error: --daemon needs XDG_RUNTIME_DIR and Unix socket support.")
+        sys.exit(1)
+
+    if sock_path.exists():
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(str(sock_path))
+            return  # Another daemon is already serving
+        except OSError:
+            sock_path.unlink()  # Stale socket from a dead daemon
+
+    script_mtime = Path(__file__).stat().st_mtime_ns
+    state = {"signature": catalog_signature(skills_dir), "data": discover_skills(skills_dir)}
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            if Path(__file__).stat().st_mtime_ns != script_mtime:
+                # Outdated code: drop the request so the client runs in-process.
+                self.server.stopping = True
+                return
+            try:
+                request = json.loads(self.rfile.readline())
+                input_str = " ".join(request.get("argv", [])).strip()
+            except (ValueError, AttributeError, TypeError):
+                return
+            if request.get("skills_dir") != str(skills_dir):
+                return  # Meant for another checkout: the client runs in-process
+
+            signature = catalog_signature(skills_dir)
+            if signature != state["signature"]:
+                state["signature"] = signature
+                state["data"] = discover_skills(skills_dir)
+
+            if state["data"]["commands"]:
+                output, returncode = capture_query(state["data"], input_str)
+            else:
+                output, returncode = "No skills found in .opencode/skills/\n", 1
+            response = {"stdout": output, "returncode": returncode}
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+    class Server(socketserver.UnixStreamServer):
+        stopping = False
+        timeout = DAEMON_IDLE_TIMEOUT
+
+        def handle_timeout(self):
+            self.stopping = True
+
+    os.umask(0o077)
+    with Server(str(sock_path), Handler) as server:
+        try:
+            while not server.stopping:
+                server.handle_request()
+        finally:
+            sock_path.unlink(missing_ok=True)
+
+
+def main():
+    # Find .opencode/skills directory
+    script_path = Path(__file__).resolve()
+    # .opencode/skills/ck-help/scripts/ck-help.py -> .opencode/skills
+    skills_dir = script_path.parent.parent.parent
+
+    if not skills_dir.exists():
+        print("Error: .opencode/skills/ directory not found.")
+        sys.exit(1)
+
+    # Parse input
+    args = sys.argv[1:]
+
+    if args and args[0] == "--daemon":
+        run_daemon(skills_dir)
+        return
+
+    # Discover skills from SKILL.md files
+    data = discover_skills(skills_dir)
+
+    if not data["commands"]:
+        print("No skills found in .opencode/skills/")
+        sys.exit(1)
+
+    if args and args[0] == "--batch":
+        run_batch(data, args[1] if len(args) > 1 else "-")
+        return
+
+    route_query(data, " ".join(args).strip())
+
+
 if __name__ == "__main__":
     main()